@@ -2,16 +2,25 @@
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import asyncio
 import pygame
 import threading
 import time
-import json
+import orjson
 import socket
+import struct
 import subprocess
+import sys
+import errno
+import selectors
+import queue
+import ipaddress
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any
 
+import numpy as np
 from airo_robots.manipulators.hardware.ur_rtde import URrtde
 from airo_robots.grippers import Robotiq2F85
 from airo_teleop.game_controller_mapping import XBox360Layout
@@ -28,15 +37,53 @@ class UR3eTeleopGUI:
         self.robot: Optional[URrtde] = None
         self.teleop: Optional[GameControllerTeleop] = None
         self.controller_connected = False
+        self._joystick: Optional[pygame.joystick.JoystickType] = None
         self.is_recording = False
-        self.recording_data: List[Dict[str, Any]] = []
+        # Recording buffers: preallocated structure-of-arrays filled by index,
+        # so the recording path allocates no per-tick dicts/lists. Full chunks
+        # are streamed to an open JSONL file, keeping memory use O(chunk) no
+        # matter how long the session runs.
+        self._rec: Dict[str, np.ndarray] = {}
+        self._rec_i = 0
+        self._rec_total = 0
+        self._rec_path = ""
+        self._rec_fh: Optional[Any] = None
+        # Samples travel from the control loop to a consumer thread through
+        # this queue, so the control tick only pays for a queue.put
+        self._rec_q: queue.SimpleQueue = queue.SimpleQueue()
+        self._rec_thread: Optional[threading.Thread] = None
         self.control_thread: Optional[threading.Thread] = None
+        self._control_executor: Optional[ThreadPoolExecutor] = None
+        self._control_loop_asyncio: Optional[asyncio.AbstractEventLoop] = None
         self.running = False
+        self._stop_evt = threading.Event()
         self.scanning = False
-        
+        # In-flight probe sockets, tracked so stop_scan can abort them
+        # instead of letting each wait out its timeout
+        self._scan_socks: set = set()
+        self._scan_lock = threading.Lock()
+        
+        # Status messages are queued (log_status is called from scan/control
+        # threads) and drained in batches on the Tk event loop.
+        self._log_q: queue.Queue = queue.Queue()
+        # (unix_second, formatted) - reformatting only when the second changes
+        self._log_ts_cache = (0, "")
+
+        self._raise_fd_limit()
         self.setup_ui()
+        self.root.after(100, self._drain_log)
         self.check_controller()
         
+    def _raise_fd_limit(self):
+        """Raise the file descriptor soft limit so batched scans can open a /24 of sockets"""
+        try:
+            import resource
+            soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft < 4096:
+                resource.setrlimit(resource.RLIMIT_NOFILE, (min(4096, hard), hard))
+        except (ImportError, ValueError, OSError):
+            pass  # not available (Windows) or not permitted - scan still works
+
     def scan_for_robots(self):
         """Scan local network for UR robots"""
         print("Starting network scan for UR robots...")
@@ -46,23 +93,25 @@ class UR3eTeleopGUI:
         def scan_thread():
             robots = []
             try:
-                # Get local network ranges to scan
-                networks = ["192.168.0", "192.168.1", "10.42.0"]
-                
+                # Only scan networks the host is actually attached to
+                networks = self._local_networks()
+
                 for network in networks:
                     if not self.scanning:
                         break
                     print(f"Scanning network {network}.x...")
                     self.log_status(f"Scanning {network}.x...")
-                    
-                    for i in range(1, 255):
-                        if not self.scanning:
-                            break
-                        ip = f"{network}.{i}"
-                        if self.check_ur_robot(ip):
+
+                    # Only probe hosts that are actually alive - dead IPs
+                    # always cost the full timeout - and probe them all in
+                    # one non-blocking batch per network.
+                    for ip in self.probe_batch(self._live_hosts(network)):
+                        if self._probe_ur(ip):
                             robots.append(ip)
                             print(f"Found UR robot at {ip}")
-                            
+                        else:
+                            print(f"{ip} has port 30004 open but is not a UR robot")
+
             except Exception as e:
                 print(f"Scan error: {str(e)}")
                 self.log_status(f"Scan error: {str(e)}")
@@ -72,20 +121,167 @@ class UR3eTeleopGUI:
         self.scanning = True
         threading.Thread(target=scan_thread, daemon=True).start()
         
-    def check_ur_robot(self, ip: str) -> bool:
-        """Check if IP has a UR robot"""
+    def _local_networks(self) -> List[str]:
+        """Determine the /24 networks this host is attached to, as 'a.b.c' base strings.
+
+        Probing networks the host isn't on just burns the full timeout on every
+        address. Parses the host's IPv4 interface addresses instead of assuming
+        fixed ranges; prefixes are clamped into [/22, /24] so the scan stays
+        bounded and point-to-point links still contribute their enclosing /24.
+        Falls back to the historical default ranges if detection fails (e.g. no
+        `ip` command).
+        """
+        networks: List[str] = []
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(0.3)
-            result = sock.connect_ex((ip, 30004))  # UR RTDE port
+            output = subprocess.run(["ip", "-o", "-4", "addr", "show"], capture_output=True, text=True, timeout=5).stdout
+        except Exception:
+            output = ""
+        for line in output.splitlines():
+            try:
+                fields = line.split()
+                if "inet" not in fields:
+                    continue
+                interface = ipaddress.ip_interface(fields[fields.index("inet") + 1])
+                if interface.ip.is_loopback:
+                    continue
+                prefix = min(max(interface.network.prefixlen, 22), 24)
+                network = ipaddress.ip_network(f"{interface.ip}/{prefix}", strict=False)
+                subnets = network.subnets(new_prefix=24) if prefix < 24 else [network]
+                for subnet in subnets:
+                    base = str(subnet.network_address).rsplit('.', 1)[0]
+                    if base not in networks:
+                        networks.append(base)
+            except ValueError:
+                continue  # one unparseable interface must not hide the others
+        return networks or ["192.168.0", "192.168.1", "10.42.0"]
+
+    def _live_hosts(self, network: str) -> List[str]:
+        """Find live hosts on a /24 network, so the UR probe only runs against responders.
+
+        Returns the union of the OS neighbour (ARP) table entries for this network
+        and a fast parallel reachability probe of the remaining addresses. The
+        neighbour table alone is not enough: it only lists hosts this machine has
+        already exchanged traffic with, which would hide e.g. a factory-fresh robot.
+        """
+        hosts = []
+        try:
+            if sys.platform == "win32":
+                output = subprocess.run(["arp", "-a"], capture_output=True, text=True, timeout=5).stdout
+            else:
+                output = subprocess.run(["ip", "neigh", "show"], capture_output=True, text=True, timeout=5).stdout
+            for line in output.splitlines():
+                if "FAILED" in line or "INCOMPLETE" in line:
+                    continue
+                ip = line.split()[0] if line.split() else ""
+                if ip.startswith(f"{network}.") and ip not in hosts:
+                    hosts.append(ip)
+        except Exception:
+            pass
+
+        # Sweep the addresses the neighbour table didn't cover with a short
+        # probe. A live host answers quickly (even with a refused connection),
+        # while a dead IP stays silent until the timeout.
+        def is_alive(ip: str) -> bool:
+            try:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                sock.settimeout(0.05)
+                result = sock.connect_ex((ip, 30004))
+                sock.close()
+                return result in (0, errno.ECONNREFUSED)
+            except:
+                return False
+
+        known = set(hosts)
+        ips = [f"{network}.{i}" for i in range(1, 255) if f"{network}.{i}" not in known]
+        with ThreadPoolExecutor(max_workers=128) as executor:
+            futures = {executor.submit(is_alive, ip): ip for ip in ips}
+            for future in as_completed(futures):
+                if not self.scanning:
+                    break
+                if future.result():
+                    hosts.append(futures[future])
+        return hosts
+
+    def probe_batch(self, ips: List[str], timeout: float = 0.15) -> List[str]:
+        """Check which IPs have a UR robot by probing the RTDE port on all of them at once.
+
+        Issues a non-blocking connect() per IP and waits for the whole batch with a
+        single selector, so probing a full /24 costs one timeout window instead of
+        one per IP (and needs no thread per probe).
+        """
+        def close_probe_socket(sock):
+            # Shut the socket down explicitly so aborted probes don't linger
+            # in CLOSE_WAIT across repeated scans
+            with self._scan_lock:
+                self._scan_socks.discard(sock)
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             sock.close()
-            if result == 0:
-                print(f"UR robot detected at {ip}")
-                return True
-            return False
-        except:
-            return False
-            
+
+        found = []
+        selector = selectors.DefaultSelector()
+        for ip in ips:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # linger=0 makes close() send RST instead of FIN, so repeated
+            # scans don't pile up sockets in TIME_WAIT
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            try:
+                sock.connect((ip, 30004))  # UR RTDE port
+            except BlockingIOError:
+                pass
+            except OSError:
+                sock.close()
+                continue
+            selector.register(sock, selectors.EVENT_WRITE, ip)
+            with self._scan_lock:
+                self._scan_socks.add(sock)
+
+        deadline = time.monotonic() + timeout
+        try:
+            while selector.get_map() and self.scanning:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    sock = key.fileobj
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        print(f"UR robot detected at {key.data}")
+                        found.append(key.data)
+                    selector.unregister(sock)
+                    close_probe_socket(sock)
+        finally:
+            for key in list(selector.get_map().values()):
+                close_probe_socket(key.fileobj)
+            selector.close()
+        return found
+
+
+    def _probe_ur(self, ip: str) -> bool:
+        """Confirm that a host with the RTDE port open really is a UR robot.
+
+        The UR Dashboard server (port 29999) greets immediately with a
+        'Connected: Universal Robots Dashboard Server' banner, which separates
+        real robots from any other device that happens to have 30004 open. A
+        host whose dashboard port is unreachable is kept as a candidate, since
+        the dashboard may simply be firewalled off.
+        """
+        try:
+            with socket.create_connection((ip, 29999), timeout=0.3) as sock:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+                sock.settimeout(0.3)
+                banner = sock.recv(64)
+            return b"Universal Robots" in banner
+        except OSError:
+            return True
+
     def scan_complete(self, robots: List[str]):
         """Handle scan completion"""
         self.scanning = False
@@ -99,8 +295,18 @@ class UR3eTeleopGUI:
             self.log_status("No robots found on network")
             
     def stop_scan(self):
-        """Stop network scan"""
+        """Stop network scan and abort any in-flight probe sockets"""
         self.scanning = False
+        with self._scan_lock:
+            socks = list(self._scan_socks)
+        for sock in socks:
+            # Shutting the socket down makes the selector return it
+            # immediately instead of waiting out the probe timeout; the scan
+            # thread still owns the close.
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
         
     def setup_ui(self):
         # Main frame
@@ -180,29 +386,60 @@ class UR3eTeleopGUI:
         
         self.status_text.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         scrollbar.grid(row=0, column=1, sticky=(tk.N, tk.S))
+
+        # Bound methods cached for the log drain path, which runs 10x/second
+        self._log_insert = self.status_text.insert
+        self._log_see = self.status_text.see
         
         # Configure grid weights
         main_frame.columnconfigure(0, weight=1)
         status_frame.columnconfigure(0, weight=1)
         
     def log_status(self, message: str):
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.status_text.insert(tk.END, f"[{timestamp}] {message}\n")
-        self.status_text.see(tk.END)
-        self.root.update_idletasks()
-        
+        # strftime only when the second actually changes - this can be called
+        # hundreds of times per second during a scan
+        now = int(time.time())
+        if now != self._log_ts_cache[0]:
+            self._log_ts_cache = (now, time.strftime("%H:%M:%S"))
+        self._log_q.put(f"[{self._log_ts_cache[1]}] {message}\n")
+
+    def _drain_log(self):
+        """Flush queued status messages to the Text widget in one batched insert"""
+        messages = []
+        while True:
+            try:
+                messages.append(self._log_q.get_nowait())
+            except queue.Empty:
+                break
+        if messages:
+            self._log_insert(tk.END, ''.join(messages))
+            # Keep the widget bounded: long sessions would otherwise accumulate
+            # megabytes of text and slow down every insert/see call
+            lines = int(self.status_text.index('end-1c').split('.')[0])
+            if lines > 500:
+                self.status_text.delete('1.0', f'{lines - 500}.0')
+            self._log_see(tk.END)
+        self.root.after(100, self._drain_log)
+
+
     def check_controller(self):
         try:
-            pygame.init()
-            pygame.joystick.init()
-            
+            # Only the joystick subsystem is needed here; a full pygame.init()
+            # would also bring up audio/video/font and cost hundreds of ms.
+            if not pygame.joystick.get_init():
+                pygame.joystick.init()
+
             if pygame.joystick.get_count() > 0:
-                controller = pygame.joystick.Joystick(0)
-                controller_name = controller.get_name()
+                # Keep the opened handle so a Refresh doesn't re-init SDL
+                if self._joystick is None or not self._joystick.get_init():
+                    self._joystick = pygame.joystick.Joystick(0)
+                    self._joystick.init()
+                controller_name = self._joystick.get_name()
                 self.controller_connected = True
                 self.controller_status.config(text=f"Connected: {controller_name}", foreground="green")
                 self.log_status(f"Controller detected: {controller_name}")
             else:
+                self._joystick = None
                 self.controller_connected = False
                 self.controller_status.config(text="No Controller Detected", foreground="red")
                 self.log_status("No controller detected")
@@ -225,6 +462,7 @@ class UR3eTeleopGUI:
             # Test basic connectivity first
             print("Testing network connectivity...")
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
             sock.settimeout(5.0)
             result = sock.connect_ex((ip, 30004))
             sock.close()
@@ -235,15 +473,26 @@ class UR3eTeleopGUI:
                 messagebox.showerror("Connection Error", error_msg)
                 return
                 
-            print("Network connectivity OK, initializing robot...")
-            self.log_status("Network OK, initializing robot...")
-            
-            # Create robot connection with timeout handling
-            self.robot = URrtde(ip, URrtde.UR3E_CONFIG)
-            
+            print("Network connectivity OK, initializing robot and gripper...")
+            self.log_status("Network OK, initializing robot and gripper...")
+
+            # The RTDE and gripper handshakes are independent blocking I/O, so
+            # run them concurrently: click-to-ready takes the slower of the
+            # two instead of their sum.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                robot_future = executor.submit(URrtde, ip, URrtde.UR3E_CONFIG)
+                gripper_future = executor.submit(Robotiq2F85, ip)
+                self.robot = robot_future.result(timeout=10)
+                try:
+                    gripper = gripper_future.result(timeout=5)
+                except Exception as e:
+                    gripper = None
+                    print(f"Gripper connection failed: {str(e)}")
+                    self.log_status(f"Gripper connection failed: {str(e)}")
+
             print("Robot connected, checking state...")
             self.log_status("Robot connected, checking state...")
-            
+
             # Check robot state
             try:
                 pose = self.robot.get_tcp_pose()
@@ -252,23 +501,17 @@ class UR3eTeleopGUI:
             except Exception as e:
                 print(f"Robot state error: {str(e)}")
                 self.log_status(f"Robot state error: {str(e)}")
-                messagebox.showwarning("Robot State", 
+                messagebox.showwarning("Robot State",
                     "Robot connected but may not be ready. Ensure robot is:\n"
                     "- Powered on\n"
                     "- Not in protective stop\n"
                     "- Program is running or robot is in remote control mode")
-            
-            # Try to connect gripper
-            print("Attempting gripper connection...")
-            try:
-                gripper = Robotiq2F85(ip)
+
+            if gripper:
                 self.robot.gripper = gripper
                 print("Gripper connected successfully")
                 self.log_status("Gripper connected")
-            except Exception as e:
-                print(f"Gripper connection failed: {str(e)}")
-                self.log_status(f"Gripper connection failed: {str(e)}")
-                
+
             self.robot_status.config(text=f"Connected to {ip}", foreground="green")
             self.connect_btn.config(text="Disconnect", command=self.disconnect_robot)
             self.update_button_states()
@@ -326,6 +569,11 @@ class UR3eTeleopGUI:
             
             print("Starting control loop...")
             self.running = True
+            # Fresh Event per session: clearing the shared one would revive a
+            # stale control thread that outlived its stop's join timeout
+            self._stop_evt = threading.Event()
+            self._control_executor = ThreadPoolExecutor(max_workers=2)
+            self._control_loop_asyncio = asyncio.new_event_loop()
             self.control_thread = threading.Thread(target=self.control_loop, daemon=True)
             self.control_thread.start()
             
@@ -341,9 +589,28 @@ class UR3eTeleopGUI:
             
     def stop_control(self):
         self.running = False
+        self._stop_evt.set()
+        # Yank any in-flight servo command at the hardware side, so the control
+        # thread can't sit blocked on an RTDE socket past the join timeout
+        # (and the robot isn't left executing commands after "Stop")
+        if self.robot is not None:
+            rtde_control = getattr(self.robot, "rtde_control", None)
+            if rtde_control is not None:
+                try:
+                    rtde_control.servoStop()
+                except Exception as e:
+                    print(f"Hardware servo stop failed: {str(e)}")
         if self.control_thread:
-            self.control_thread.join(timeout=2.0)
-            
+            self.control_thread.join(timeout=0.5)
+        if self._control_executor:
+            self._control_executor.shutdown(wait=False)
+            self._control_executor = None
+        # Only drop the loop reference once the thread is confirmed dead; a
+        # thread that outlived the join timeout still owns (and will close)
+        # its loop via the local reference in control_loop.
+        if self.control_thread is None or not self.control_thread.is_alive():
+            self._control_loop_asyncio = None
+
         if self.is_recording:
             self.toggle_recording()
             
@@ -352,78 +619,187 @@ class UR3eTeleopGUI:
         self.log_status("Robot control stopped")
         
     def control_loop(self):
+        """Thread target: runs the async control loop on a dedicated asyncio event loop"""
+        # Work on a local reference: if this thread outlives the 0.5s stop
+        # timeout, stop_control may null the attribute (or a new session may
+        # replace it) before the finally block runs, and this thread must not
+        # close the new session's loop.
+        loop = self._control_loop_asyncio
+        asyncio.set_event_loop(loop)
+        try:
+            loop.run_until_complete(self._control_loop_async())
+        finally:
+            loop.close()
+
+    async def _control_loop_async(self):
         print("Control loop started")
+        # Ticks are scheduled against absolute deadlines (t0 + k*dt) on the
+        # asyncio timer, which keeps the control rate an exact multiple of dt
+        # without the drift of per-iteration sleep(dt) or the CPU burn of a
+        # spin-wait. If a tick overruns its deadline, the missed frames are
+        # dropped so the loop re-synchronizes instead of running late forever.
+        dt = 1 / 20  # 20 Hz control rate
+        loop = asyncio.get_running_loop()
+        # Session-local reference: a later session replaces the attribute, and
+        # its Event must not control this loop
+        stop_evt = self._stop_evt
+        t0 = loop.time()
+        k = 1
+        dropped_frames = 0
         try:
-            while self.running:
+            while not stop_evt.is_set():
                 if self.teleop:
-                    twist = self.teleop.read_twist_and_servo_to_target_position()
-                    self.teleop.read_gripper_delta_and_move_gripper()
-                    
+                    # The servo command and the recording state read are both
+                    # socket I/O (the GIL is released while they wait), so run
+                    # them on the executor concurrently: a tick then costs
+                    # max(servo, state read) instead of their sum.
+                    servo_future = loop.run_in_executor(
+                        self._control_executor, self.teleop.read_twist_and_servo_to_target_position
+                    )
                     if self.is_recording:
-                        self.record_data_point(twist)
-                        
-                time.sleep(1/20)  # 20 Hz control rate
-                
+                        state_future = loop.run_in_executor(self._control_executor, self._snapshot_state)
+                        twist = await servo_future
+                        pose, gripper_width = await state_future
+                        # Hand the sample to the recording thread; buffer fills
+                        # and chunk flushes must not eat into the tick deadline
+                        self._rec_q.put((time.time(), twist, pose, gripper_width))
+                    else:
+                        twist = await servo_future
+                    await loop.run_in_executor(self._control_executor, self.teleop.read_gripper_delta_and_move_gripper)
+
+                target = t0 + k * dt
+                now = loop.time()
+                if now > target:
+                    missed = int((now - target) / dt) + 1
+                    dropped_frames += missed
+                    k += missed
+                    print(f"Control tick overran its deadline, dropped {missed} frame(s) ({dropped_frames} total)")
+                else:
+                    await asyncio.sleep(target - now)
+                    k += 1
+
         except Exception as e:
             error_msg = f"Control loop error: {str(e)}"
             print(f"ERROR: {error_msg}")
             self.log_status(error_msg)
             self.running = False
-        
+            stop_evt.set()
+
         print("Control loop ended")
             
     def toggle_recording(self):
         if not self.is_recording:
+            self._allocate_recording_buffers(20 * 60)  # one-minute chunks at 20 Hz
+            self._rec_total = 0
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            self._rec_path = f"ur3e_recording_{timestamp}.jsonl"
+            try:
+                self._rec_fh = open(self._rec_path, 'wb', buffering=1 << 16)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open recording file: {str(e)}")
+                self.log_status(f"Recording start failed: {str(e)}")
+                return
+            # Header line with the recording metadata; data points follow one per line
+            self._rec_fh.write(orjson.dumps({
+                'robot_ip': self.robot_combo.get(),
+                'recording_time': timestamp
+            }) + b"\n")
+            # Fresh queue per session: a control tick that passed its
+            # is_recording check just as the previous session stopped may have
+            # enqueued a sample after the sentinel, and that stale point must
+            # not leak into this recording.
+            self._rec_q = queue.SimpleQueue()
+            self._rec_thread = threading.Thread(target=self._rec_worker, daemon=True)
+            self._rec_thread.start()
             self.is_recording = True
-            self.recording_data = []
             self.record_btn.config(text="Stop Recording")
             self.record_status.config(text="Recording...", foreground="red")
             self.save_btn.config(state="disabled")
-            self.log_status("Recording started")
+            self.log_status(f"Recording started - streaming to {self._rec_path}")
         else:
             self.is_recording = False
+            # Sentinel lets the worker drain any queued samples before exiting
+            self._rec_q.put(None)
+            if self._rec_thread:
+                self._rec_thread.join(timeout=2.0)
+                self._rec_thread = None
+            self._flush_recording()
+            if self._rec_fh:
+                self._rec_fh.close()
+                self._rec_fh = None
             self.record_btn.config(text="Start Recording")
-            self.record_status.config(text=f"Recorded {len(self.recording_data)} points", foreground="blue")
+            self.record_status.config(text=f"Recorded {self._rec_total} points", foreground="blue")
             self.save_btn.config(state="normal")
-            self.log_status(f"Recording stopped - {len(self.recording_data)} data points")
+            self.log_status(f"Recording stopped - {self._rec_total} data points in {self._rec_path}")
+
+    def _allocate_recording_buffers(self, capacity: int):
+        self._rec = {
+            'timestamp': np.empty(capacity, np.float64),
+            'tcp_pose': np.empty((capacity, 4, 4), np.float64),
+            'twist': np.empty((capacity, 6), np.float64),
+            'gripper_width': np.empty(capacity, np.float64),
+        }
+        self._rec_i = 0
             
-    def record_data_point(self, twist):
-        if self.robot:
-            data_point = {
-                'timestamp': time.time(),
-                'tcp_pose': self.robot.get_tcp_pose().tolist(),
-                'twist': twist.tolist(),
-                'gripper_width': self.robot.gripper.get_current_width() if self.robot.gripper else None
-            }
-            self.recording_data.append(data_point)
+    def _snapshot_state(self):
+        """Read the robot state needed for a recording sample"""
+        pose = self.robot.get_tcp_pose()
+        gripper_width = self.robot.gripper.get_current_width() if self.robot.gripper else None
+        return pose, gripper_width
+
+    def _rec_worker(self):
+        """Consumer thread for recording samples; stops on the None sentinel"""
+        # Local reference, so a worker that outlives its session can never
+        # consume from a later session's queue
+        rec_q = self._rec_q
+        while True:
+            sample = rec_q.get()
+            if sample is None:
+                break
+            self.record_data_point(*sample)
+
+    def record_data_point(self, timestamp, twist, pose, gripper_width):
+        i = self._rec_i
+        if i == len(self._rec['timestamp']):
+            # Chunk full: stream it to disk and start refilling
+            self._flush_recording()
+            i = self._rec_i
+        self._rec['timestamp'][i] = timestamp
+        self._rec['tcp_pose'][i] = pose
+        self._rec['twist'][i] = twist
+        self._rec['gripper_width'][i] = gripper_width if gripper_width is not None else np.nan
+        self._rec_i = i + 1
+
+    def _flush_recording(self):
+        """Write the buffered chunk to the recording file as JSON lines"""
+        n = self._rec_i
+        if not n or not self._rec_fh:
+            return
+        lines = []
+        for i in range(n):
+            gripper_width = self._rec['gripper_width'][i]
+            # orjson serializes the numpy arrays/scalars directly - no .tolist() copies
+            lines.append(orjson.dumps({
+                'timestamp': self._rec['timestamp'][i],
+                'tcp_pose': self._rec['tcp_pose'][i],
+                'twist': self._rec['twist'][i],
+                'gripper_width': None if np.isnan(gripper_width) else gripper_width
+            }, option=orjson.OPT_SERIALIZE_NUMPY))
+        self._rec_fh.write(b"\n".join(lines) + b"\n")
+        self._rec_total += n
+        self._rec_i = 0
             
     def save_recording(self):
-        if not self.recording_data:
+        if not self._rec_total:
             messagebox.showwarning("Warning", "No recording data to save")
             return
-            
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"ur3e_recording_{timestamp}.json"
-        
-        try:
-            with open(filename, 'w') as f:
-                json.dump({
-                    'metadata': {
-                        'robot_ip': self.robot_combo.get(),
-                        'recording_time': timestamp,
-                        'data_points': len(self.recording_data)
-                    },
-                    'data': self.recording_data
-                }, f, indent=2)
-                
-            self.log_status(f"Recording saved to {filename}")
-            messagebox.showinfo("Success", f"Recording saved to {filename}")
-            self.save_btn.config(state="disabled")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to save recording: {str(e)}")
-            self.log_status(f"Save failed: {str(e)}")
-            
+
+        # Data points are streamed to disk while recording, so there is
+        # nothing left to serialize here.
+        self.log_status(f"Recording saved to {self._rec_path}")
+        messagebox.showinfo("Success", f"Recording saved to {self._rec_path}")
+        self.save_btn.config(state="disabled")
+
     def run(self):
         self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
         self.root.mainloop()
@@ -433,6 +809,9 @@ class UR3eTeleopGUI:
             self.stop_control()
         if self.scanning:
             self.stop_scan()
+        if self._joystick is not None:
+            self._joystick.quit()
+            self._joystick = None
         self.root.destroy()
 
 
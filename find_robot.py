@@ -1,12 +1,48 @@
 #!/usr/bin/env python3
 
+import atexit
 import socket
+import struct
+import selectors
 import sys
 import os
+import time
+import threading
+from contextlib import contextmanager
 
 # Add the airo_teleop module to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'airo_teleop'))
 
+# Keep one URrtde instance per IP so re-verifying a robot (e.g. scan followed
+# by an explicit check) reuses the open connection instead of paying the
+# multi-second RTDE handshake again.
+_rtde_pool = {}
+_rtde_pool_lock = threading.Lock()
+
+@contextmanager
+def rtde(ip):
+    """Get the pooled URrtde connection for an IP, creating it on first use"""
+    from airo_robots.manipulators.hardware.ur_rtde import URrtde
+
+    with _rtde_pool_lock:
+        robot = _rtde_pool.get(ip)
+        if robot is None:
+            robot = URrtde(ip, URrtde.UR3E_CONFIG)
+            _rtde_pool[ip] = robot
+    yield robot
+
+def _shutdown_rtde_pool():
+    with _rtde_pool_lock:
+        for robot in _rtde_pool.values():
+            try:
+                robot.rtde_control.disconnect()
+                robot.rtde_receive.disconnect()
+            except Exception:
+                pass
+        _rtde_pool.clear()
+
+atexit.register(_shutdown_rtde_pool)
+
 def check_robot_connection(ip):
     """Test if robot is reachable and get basic info"""
     print(f"Testing connection to {ip}...")
@@ -21,18 +57,16 @@ def check_robot_connection(ip):
         if result == 0:
             print(f"✓ RTDE port (30004) is open on {ip}")
             
-            # Try to connect with URrtde
+            # Try to connect with URrtde (pooled, so repeated checks reuse it)
             try:
-                from airo_robots.manipulators.hardware.ur_rtde import URrtde
                 print("Attempting robot connection...")
-                robot = URrtde(ip, URrtde.UR3E_CONFIG)
-                
-                # Test getting pose
-                pose = robot.get_tcp_pose()
+                with rtde(ip) as robot:
+                    # Test getting pose
+                    pose = robot.get_tcp_pose()
                 print(f"✓ Robot connected successfully!")
                 print(f"✓ TCP pose retrieved - Robot is ready")
                 return True
-                
+
             except Exception as e:
                 print(f"✗ Robot connection failed: {str(e)}")
                 print("  Robot may be in protective stop or wrong mode")
@@ -45,29 +79,70 @@ def check_robot_connection(ip):
         print(f"✗ Network error: {str(e)}")
         return False
 
+def probe_batch(ips, timeout=0.15):
+    """Check which IPs have the UR RTDE port open, probing the whole batch at once.
+
+    Issues a non-blocking connect() per IP and waits on all of them with a single
+    selector, so a full /24 costs one timeout window instead of one per IP.
+    """
+    def close_probe_socket(sock):
+        # Shut the socket down explicitly so aborted probes don't linger in
+        # CLOSE_WAIT across repeated scans
+        try:
+            sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        sock.close()
+
+    found = []
+    selector = selectors.DefaultSelector()
+    for ip in ips:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setblocking(False)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # linger=0 makes close() send RST instead of FIN, so repeated scans
+        # don't pile up sockets in TIME_WAIT
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+        try:
+            sock.connect((ip, 30004))
+        except BlockingIOError:
+            pass
+        except OSError:
+            sock.close()
+            continue
+        selector.register(sock, selectors.EVENT_WRITE, ip)
+
+    deadline = time.monotonic() + timeout
+    try:
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(timeout=remaining):
+                sock = key.fileobj
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    found.append(key.data)
+                selector.unregister(sock)
+                close_probe_socket(sock)
+    finally:
+        for key in list(selector.get_map().values()):
+            close_probe_socket(key.fileobj)
+        selector.close()
+    return found
+
 def scan_network():
     """Scan for UR robots on common networks"""
     print("Scanning for UR robots...")
     networks = ["192.168.0", "192.168.1", "10.42.0"]
     found_robots = []
-    
+
     for network in networks:
         print(f"\nScanning {network}.x...")
-        for i in range(1, 255):
-            ip = f"{network}.{i}"
-            try:
-                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(0.1)
-                result = sock.connect_ex((ip, 30004))
-                sock.close()
-                
-                if result == 0:
-                    print(f"Found potential robot at {ip}")
-                    found_robots.append(ip)
-                    
-            except:
-                pass
-                
+        for ip in probe_batch([f"{network}.{i}" for i in range(1, 255)]):
+            print(f"Found potential robot at {ip}")
+            found_robots.append(ip)
+
     return found_robots
 
 if __name__ == "__main__":
@@ -13,6 +13,7 @@ setuptools.setup(
         "pygame",
         "click",
         "loguru",
+        "orjson",
         "airo-typing>=2025.9.0",
         "airo-spatial-algebra>=2025.9.0",
         "airo-robots>=2025.9.0",